@@ -3,7 +3,7 @@ progressor-lib - Enhanced progress bars with themes, colors, and custom template
 Minimal dependencies, no external libraries needed.
 """
 
-from .progress import get_progress_drawer, ProgressStyle, MultiProgress
+from .progress import get_progress_drawer, iter_wrap, ProgressStyle, MultiProgress
 from .colors import Colors, ColorTheme, apply_color
 from .themes import (
     UnicodeBlocks, GeometricSymbols, EmojiThemes,
@@ -13,6 +13,7 @@ from .themes import (
 __version__ = "1.0.1"
 __all__ = [
     "get_progress_drawer",
+    "iter_wrap",
     "ProgressStyle",
     "MultiProgress",
     "Colors",
@@ -6,7 +6,9 @@ Minimal dependencies, no external libraries needed.
 
 import sys
 import time
-from typing import Callable, Optional, Union, List, Tuple
+from functools import lru_cache, partial
+from itertools import cycle
+from typing import Callable, Iterable, Iterator, Optional, Union, List, Sequence, Tuple, TypeVar
 
 # Import new modules
 from .colors import ColorTheme
@@ -40,6 +42,194 @@ class ProgressStyle:
     BOUNCE = "bounce"           # (→    ) ( →   ) etc.
 
 
+# Draw functions map progress (0..1) to the (filled, empty) parts of the bar
+_DrawFunc = Callable[[float], Tuple[str, str]]
+
+
+def _fill_tables(filled_char: str, empty_char: str, width: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Precompute the filled and empty parts for every filled-cell count"""
+    filled_tbl = tuple(filled_char * i for i in range(width + 1))
+    empty_tbl = tuple(empty_char * (width - i) for i in range(width + 1))
+    return filled_tbl, empty_tbl
+
+
+def _shade_tables(shades: Sequence[str], width: int, pad: str = "") -> Tuple[Tuple[str, ...], ...]:
+    """Precompute the filled part for every shade and filled-cell count"""
+    return tuple(
+        tuple(shade * i + pad * (width - i) for i in range(width + 1))
+        for shade in shades
+    )
+
+
+def _sub_cell_table(chars: str, full_char: str, width: int) -> Tuple[str, ...]:
+    """Precompute every bar for styles that fill a cell in len(chars)-1 steps"""
+    steps = len(chars) - 1
+    table = []
+    for filled in range(width * steps + 1):
+        full, part = divmod(filled, steps)
+        if part:
+            table.append(full_char * full + chars[part] + " " * (width - full - 1))
+        else:
+            table.append(full_char * full + " " * (width - full))
+    return tuple(table)
+
+
+def _build_fill(filled_char: str, empty_char: str, width: int, spinner_only: bool = False) -> _DrawFunc:
+    """Constant characters: only width+1 distinct bars, so build them once"""
+    filled_tbl, empty_tbl = _fill_tables(filled_char, empty_char, width)
+    # Constants are bound as defaults so they load as fast locals; scale
+    # factors are floats so progress * scale stays a float-only multiply
+    def draw_func(p: float, _w=float(width), _tbl_f=filled_tbl, _tbl_e=empty_tbl):
+        filled = int(p * _w)
+        return _tbl_f[filled], _tbl_e[filled]
+    return draw_func
+
+
+def _build_sub_cell(chars: str, full_char: str, width: int, spinner_only: bool = False) -> _DrawFunc:
+    """Smooth bar that fills each cell in len(chars)-1 steps"""
+    bar_tbl = _sub_cell_table(chars, full_char, width)
+    max_filled = len(bar_tbl) - 1
+    blank = " " * width
+    def draw_func(p: float, _max=float(max_filled), _tbl=bar_tbl, _blank=blank):
+        return _tbl[int(p * _max)], _blank
+    return draw_func
+
+
+def _build_shaded(shades: Sequence[str], width: int, spinner_only: bool = False) -> _DrawFunc:
+    """All filled cells share one shade, growing with progress"""
+    shade_tbl = _shade_tables(shades, width, " ")
+    last_shade = len(shades) - 1
+    blank = " " * width
+    def draw_func(p: float, _w=float(width), _n=float(len(shades)), _last=last_shade, _tbl=shade_tbl, _blank=blank):
+        idx = min(int(p * _n), _last)
+        return _tbl[idx][int(p * _w)], _blank
+    return draw_func
+
+
+def _build_progressive(chars: Sequence[str], width: int, spinner_only: bool = False) -> _DrawFunc:
+    """Progressive fill: filled cells use the character matching progress"""
+    if len(chars) == 0:
+        raise ValueError("Character list cannot be empty")
+    shade_tbl = _shade_tables(chars, width)
+    empty_tbl = shade_tbl[0][::-1]
+    last_shade = len(chars) - 1
+    def draw_func(p: float, _w=float(width), _n=float(len(chars)), _last=last_shade, _tbl=shade_tbl, _tbl_e=empty_tbl):
+        filled = int(p * _w)
+        idx = min(int(p * _n), _last)
+        return _tbl[idx][filled], _tbl_e[filled]
+    return draw_func
+
+
+def _build_gradient(width: int, spinner_only: bool = False) -> _DrawFunc:
+    """Shaded bar that gets darker as it fills"""
+    shade_tbl = _shade_tables("░▒▓", width, " ")
+    blank = " " * width
+    def draw_func(p: float, _w=float(width), _tbl=shade_tbl, _blank=blank):
+        # More filled = darker shade
+        idx = 0 if p < 0.33 else 1 if p < 0.66 else 2
+        return _tbl[idx][int(p * _w)], _blank
+    return draw_func
+
+
+def _build_bounce(width: int, spinner_only: bool = False) -> _DrawFunc:
+    """Arrow bouncing inside brackets, positioned by progress"""
+    frames = ["(→    )", "( →   )", "(  →  )", "(   → )", "(    →)", 
+             "(   ← )", "(  ←  )", "( ←   )", "(←    )"]
+    last_frame = len(frames) - 1
+    def bounce(p: float, _last=float(last_frame), _frames=frames):
+        # Scale frame based on progress
+        return _frames[int(p * _last)], ""
+    return bounce
+
+
+def _build_spinner(frames: Sequence[str], width: int, spinner_only: bool = False) -> _DrawFunc:
+    """Spinner that advances one frame per draw, ignoring progress"""
+    if spinner_only:
+        frames = [s * (width // 3) for s in frames]
+    next_frame = cycle(frames).__next__
+    def spin(_: float, _next=next_frame):
+        return _next(), ""
+    return spin
+
+
+# Style name -> builder(width, spinner_only) returning a draw function
+_STYLE_BUILDERS = {
+    "block": partial(_build_sub_cell, " ▏▎▍▋▊▉", "▉"),
+    "classic": partial(_build_fill, "■", "□"),
+    "braille": partial(_build_sub_cell, " ⡀⡄⡆⡇", "⡿"),
+    "arrow": partial(_build_fill, ">", "-"),
+    "equal": partial(_build_fill, "=", "-"),
+    "dot": partial(_build_fill, "•", "."),
+    "spin_simple": partial(_build_spinner, r"\|/-"),
+    "spin_dots": partial(_build_spinner, "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"),
+    "spin_arrow": partial(_build_spinner, ["←", "↖", "↑", "↗", "→", "↘", "↓", "↙"]),
+    "vertical": partial(_build_shaded, UnicodeBlocks.VERTICAL),
+    "circle": partial(_build_progressive, GeometricSymbols.CIRCLES["filled"]),
+    "square": partial(_build_progressive, GeometricSymbols.SQUARES),
+    "gradient": _build_gradient,
+    "hash": partial(_build_fill, "#", "."),
+    "star": partial(_build_fill, "★", "☆"),
+    "triangle": partial(_build_fill, "▲", "▽"),
+    "bounce": _build_bounce,
+}
+
+
+def _clamp(progress: float) -> float:
+    """Clamp progress to [0, 1]; NaN fails every comparison and maps to 1"""
+    return 0.0 if progress < 0.0 else (1.0 if progress > 1.0 or progress != progress else progress)
+
+
+def _format_eta(eta: float) -> str:
+    """Format remaining seconds with a unit suited to the magnitude"""
+    if eta < 60:
+        return f"ETA {eta:.1f}s"
+    elif eta < 3600:
+        return f"ETA {eta/60:.1f}m"
+    else:
+        return f"ETA {eta/3600:.1f}h"
+
+
+def _format_speed(speed: float) -> str:
+    """Format operations per second with a K/M suffix"""
+    if speed < 1000:
+        return f"{speed:.1f}/s"
+    elif speed < 1_000_000:
+        return f"{speed/1000:.1f}K/s"
+    else:
+        return f"{speed/1_000_000:.1f}M/s"
+
+
+def _build_info_formatter(
+    show_percentage: bool,
+    show_counter: bool,
+    show_eta: bool,
+    show_speed: bool
+) -> Callable[[float, Optional[int], Optional[float], Optional[float]], str]:
+    """
+    Generate the info suffix formatter (" │ 42.0%  1,234  ETA 3.0s")
+    specialized for the enabled fields, so a frame runs no checks for
+    disabled ones. The source is assembled from fixed fragments only.
+    """
+    lines = ["def format_info(p, c, e, s):"]
+    if not (show_counter or show_eta or show_speed):
+        lines.append('    return f" │ {p:5.1%}"' if show_percentage else '    return ""')
+    else:
+        lines.append('    tail = ""')
+        if show_counter:
+            lines.append('    if c is not None: tail += f"  {c:,}"')
+        if show_eta:
+            lines.append('    if e is not None and e > 0: tail += "  " + _format_eta(e)')
+        if show_speed:
+            lines.append('    if s is not None: tail += "  " + _format_speed(s)')
+        if show_percentage:
+            lines.append('    return f" │ {p:5.1%}" + tail')
+        else:
+            lines.append('    return " │ " + tail[2:] if tail else ""')
+    namespace = {"_format_eta": _format_eta, "_format_speed": _format_speed}
+    exec("\n".join(lines), namespace)
+    return namespace["format_info"]
+
+
 def get_progress_drawer(
     style: Union[str, List[str]] = "block",
     width: int = 30,
@@ -49,7 +239,9 @@ def get_progress_drawer(
     show_speed: bool = False,  # NEW: Show operations per second
     spinner_only: bool = False,
     color_theme: Optional[Union[str, Callable]] = None,
-    custom_chars: Optional[Tuple[str, str]] = None
+    custom_chars: Optional[Tuple[str, str]] = None,
+    refresh_hz: float = 30.0,
+    line_mode: Optional[bool] = None
 ) -> Callable[[float, Optional[int], Optional[float], Optional[float]], None]:
     """
     Factory that returns a progress drawing function with selected style.
@@ -61,212 +253,49 @@ def get_progress_drawer(
                 eta: float | None = None, speed: float | None = None) -> None:
             # progress ∈ [0,1]
             # speed: operations per second (if show_speed=True)
+
+    Output is buffered and written at most ``refresh_hz`` times per second
+    (and always on completion) to the ``sys.stdout`` that was current when
+    the drawer was created. The latest frame may still be pending when
+    drawing stops or pauses below 100%; call ``draw.flush()`` to show it.
+    ``draw.render(...)`` returns the line as a string without writing it.
+
+    ``line_mode`` writes one plain line per 10% step instead of redrawing
+    in place. It defaults to None, which enables it when stdout is not a
+    terminal (a file, pipe or CI log); pass False to keep the live bar on
+    consoles that support "\r" but don't report as a TTY.
     """
 
-    # Track start time for speed calculation
-    start_time = time.time()
-    last_update = start_time
+    # Resolve hot attribute lookups once; output goes to the stdout
+    # current when the drawer is created
+    _write = sys.stdout.write
+    _flush = sys.stdout.flush
+    if line_mode is None:
+        _isatty = getattr(sys.stdout, "isatty", None)
+        line_mode = not (_isatty and _isatty())
+    _monotonic = time.monotonic
+    _monotonic_ns = time.monotonic_ns
+
+    # Track last sample for speed calculation (integer nanoseconds)
+    last_update = _monotonic_ns()
     last_value = 0
     
     # Determine style and handle custom inputs
-    style_name = ""
-    filled_char = ""
-    empty_char = ""
-    chars = []
-    
     if custom_chars is not None:
         # User provided custom characters like ("@", ".")
         filled_char, empty_char = custom_chars
-        style_name = "custom"
+        draw_func = _build_fill(filled_char, empty_char, width)
     elif isinstance(style, list):
         # User provided a list of characters for progressive fill
-        chars = style
-        if len(chars) < 1:
+        if len(style) < 1:
             raise ValueError("Character list must have at least one character")
-        style_name = "custom_list"
+        draw_func = _build_progressive(style, width)
     else:
-        # Regular style name
-        style_name = style.lower()
-    
-    # Map style names to drawing functions
-    if style_name == "block":
-        chars = " ▏▎▍▋▊▉"
-        def draw_func(p: float):
-            filled = int(p * (width * len(chars)-1))
-            full = filled // (len(chars)-1)
-            part = filled % (len(chars)-1)
-            bar = chars[-1] * full + (chars[part] if part else "")
-            bar += " " * (width - len(bar))
-            return bar, " " * width
-
-    elif style_name == "classic":
-        def draw_func(p: float):
-            filled = int(p * width)
-            return "■" * filled, "□" * (width - filled)
-
-    elif style_name == "braille":
-        braille = " ⡀⡄⡆⡇⡏⡟⡿⣿"
-        def draw_func(p: float):
-            filled = int(p * width * 4)
-            full = filled // 4
-            part = filled % 4
-            bar = braille[7] * full + (braille[part] if part else "")
-            bar += " " * (width - len(bar))
-            return bar, " " * width
-
-    elif style_name == "arrow":
-        def draw_func(p: float):
-            filled = int(p * width)
-            return ">" * filled, "-" * (width - filled)
-
-    elif style_name == "equal":
-        def draw_func(p: float):
-            filled = int(p * width)
-            return "=" * filled, "-" * (width - filled)
-
-    elif style_name == "dot":
-        def draw_func(p: float):
-            filled = int(p * width)
-            return "•" * filled, "." * (width - filled)
-
-    elif style_name == "vertical":
-        vertical_chars = UnicodeBlocks.VERTICAL
-        def draw_func(p: float):
-            filled = int(p * width)
-            bar = ""
-            for i in range(width):
-                if i < filled:
-                    # Use different heights based on position
-                    height_idx = min(int(p * len(vertical_chars)), len(vertical_chars)-1)
-                    bar += vertical_chars[height_idx]
-                else:
-                    bar += " "
-            return bar, " " * width
-
-    elif style_name == "circle":
-        circle_chars = GeometricSymbols.CIRCLES["filled"]
-        def draw_func(p: float):
-            filled = int(p * width)
-            filled_part = ""
-            for i in range(filled):
-                # Progressively fill circles
-                idx = min(int(p * len(circle_chars)), len(circle_chars)-1)
-                filled_part += circle_chars[idx]
-            empty_part = circle_chars[0] * (width - filled)
-            return filled_part, empty_part
-
-    elif style_name == "square":
-        square_chars = GeometricSymbols.SQUARES
-        def draw_func(p: float):
-            filled = int(p * width)
-            filled_part = ""
-            for i in range(filled):
-                # Progressively fill squares
-                idx = min(int(p * len(square_chars)), len(square_chars)-1)
-                filled_part += square_chars[idx]
-            empty_part = square_chars[0] * (width - filled)
-            return filled_part, empty_part
-
-    elif style_name == "gradient":
-        def draw_func(p: float):
-            filled = int(p * width)
-            bar = ""
-            for i in range(width):
-                if i < filled:
-                    # More filled = darker shade
-                    if p < 0.33:
-                        bar += "░"
-                    elif p < 0.66:
-                        bar += "▒"
-                    else:
-                        bar += "▓"
-                else:
-                    bar += " "
-            return bar, " " * width
-
-    elif style_name == "hash":
-        def draw_func(p: float):
-            filled = int(p * width)
-            return "#" * filled, "." * (width - filled)
-
-    elif style_name == "star":
-        def draw_func(p: float):
-            filled = int(p * width)
-            return "★" * filled, "☆" * (width - filled)
-
-    elif style_name == "triangle":
-        def draw_func(p: float):
-            filled = int(p * width)
-            return "▲" * filled, "▽" * (width - filled)
-
-    elif style_name == "bounce":
-        frames = ["(→    )", "( →   )", "(  →  )", "(   → )", "(    →)", 
-                 "(   ← )", "(  ←  )", "( ←   )", "(←    )"]
-        def make_bounce():
-            i = 0
-            def bounce(p: float):
-                nonlocal i
-                # Scale frame based on progress
-                frame_idx = int(p * (len(frames) - 1))
-                s = frames[frame_idx]
-                i = (i + 1) % len(frames)
-                return s, ""
-            return bounce
-        
-        draw_func = make_bounce()
-
-    elif style_name == "spin_arrow":
-        frames = ["←", "↖", "↑", "↗", "→", "↘", "↓", "↙"]
-        def make_spinner():
-            i = 0
-            def spin(_: float):
-                nonlocal i
-                s = frames[i % len(frames)]
-                i = (i + 1) % len(frames)
-                return s * (width // 3) if spinner_only else s, ""
-            return spin
-        
-        draw_func = make_spinner()
-
-    elif style_name in ("spin_simple", "spin_dots"):
-        if style_name == "spin_simple":
-            frames = r"\|/-"
-        else:
-            frames = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
-
-        def make_spinner():
-            i = 0
-            def spin(_: float):
-                nonlocal i
-                s = frames[i % len(frames)]
-                i = (i + 1) % len(frames)
-                return s * (width // 3) if spinner_only else s, ""
-            return spin
-        
-        draw_func = make_spinner()
-
-    elif style_name == "custom":
-        # Custom characters from user (filled_char, empty_char)
-        def draw_func(p: float):
-            filled = int(p * width)
-            return filled_char * filled, empty_char * (width - filled)
-
-    elif style_name == "custom_list":
-        # List of characters for progressive fill
-        if len(chars) == 0:
-            raise ValueError("Character list cannot be empty")
-        def draw_func(p: float):
-            filled = int(p * width)
-            filled_part = ""
-            for i in range(filled):
-                # Use character based on position in sequence
-                idx = min(int(p * len(chars)), len(chars)-1)
-                filled_part += chars[idx]
-            empty_part = chars[0] * (width - filled)
-            return filled_part, empty_part
-
-    else:
-        raise ValueError(f"Unknown style: {style!r}. Available: {', '.join([k for k in ProgressStyle.__dict__.keys() if not k.startswith('_')])}")
+        # Regular style name; interned so the lookup matches by identity
+        builder = _STYLE_BUILDERS.get(sys.intern(style.lower()))
+        if builder is None:
+            raise ValueError(f"Unknown style: {style!r}. Available: {', '.join([k for k in ProgressStyle.__dict__.keys() if not k.startswith('_')])}")
+        draw_func = builder(width, spinner_only)
 
     # Color theme handler
     if color_theme is None:
@@ -288,33 +317,55 @@ def get_progress_drawer(
     else:
         color_handler = ColorTheme.default
 
-    def draw(
+    # Built-in themes are pure, and a bar only has a handful of distinct
+    # frames, so reuse the colored bar. Progress is keyed to whole percent,
+    # which keeps every built-in theme threshold exact.
+    colored_bar = None
+    if color_handler is not ColorTheme.default and not callable(color_theme):
+        @lru_cache(maxsize=(width + 1) * 16)
+        def colored_bar(filled_part: str, empty_part: str, percent: int) -> str:
+            filled_part, empty_part = color_handler(filled_part, empty_part, percent / 100)
+            return filled_part + empty_part
+
+    format_info = _build_info_formatter(show_percentage, show_counter, show_eta, show_speed)
+
+    # Pending output, written in a single call by flush()
+    _buf: List[str] = []
+    flush_interval = 1.0 / refresh_hz if refresh_hz > 0 else 0.0
+    last_flush = 0.0
+
+    # Throttle state: a frame is skipped when it falls in the same
+    # sub-cell bucket as the last one and came too soon after it
+    _last_render_t = 0.0
+    _last_bucket = -1
+    bucket_scale = float(width * 8)
+
+    def flush():
+        """Write the buffered output to stdout in one go"""
+        nonlocal last_flush
+        if _buf:
+            _write("".join(_buf))
+            _buf.clear()
+        _flush()
+        last_flush = _monotonic()
+
+    def _render(
         progress: float,
-        current: Optional[int] = None,
-        eta: Optional[float] = None,
-        speed: Optional[float] = None
-    ):
-        """
-        Draw progress bar according to selected style
-        
-        Args:
-            progress: 0..1
-            current: Current item count (if show_counter=True)
-            eta: Estimated time remaining in seconds (if show_eta=True)
-            speed: Operations per second (if show_speed=True)
-        """
+        current: Optional[int],
+        eta: Optional[float],
+        speed: Optional[float]
+    ) -> str:
+        """Render the line for an already clamped progress"""
         # Fix variable scope issue
         nonlocal last_update, last_value
         
-        if not 0 <= progress <= 1:
-            progress = max(0, min(1, progress))
-        
-        # Calculate speed if not provided but requested
+        # Calculate speed if not provided but requested; render only runs
+        # for frames that pass the throttle, so the clock is read per frame
         computed_speed = None
         if show_speed and speed is None and current is not None:
-            now = time.time()
+            now = _monotonic_ns()
             if now > last_update:
-                computed_speed = (current - last_value) / (now - last_update)
+                computed_speed = (current - last_value) * 1_000_000_000 / (now - last_update)
                 last_update = now
                 last_value = current
         
@@ -322,52 +373,170 @@ def get_progress_drawer(
         filled_part, empty_part = draw_func(progress)
         
         # Apply color theme
-        if color_handler:
+        if colored_bar is not None:
+            bar = colored_bar(filled_part, empty_part, int(progress * 100))
+        else:
             filled_part, empty_part = color_handler(filled_part, empty_part, progress)
+            bar = filled_part + empty_part
         
-        bar = filled_part + empty_part
-        
-        # Build info parts
-        parts = []
-        
-        if show_percentage:
-            parts.append(f"{progress:5.1%}")
-        
-        if show_counter and current is not None:
-            parts.append(f"{current:,}")
-        
-        if show_eta and eta is not None and eta > 0:
-            if eta < 60:
-                parts.append(f"ETA {eta:.1f}s")
-            elif eta < 3600:
-                parts.append(f"ETA {eta/60:.1f}m")
-            else:
-                parts.append(f"ETA {eta/3600:.1f}h")
-        
-        if show_speed:
-            speed_to_show = speed if speed is not None else computed_speed
-            if speed_to_show is not None:
-                if speed_to_show < 1000:
-                    parts.append(f"{speed_to_show:.1f}/s")
-                elif speed_to_show < 1_000_000:
-                    parts.append(f"{speed_to_show/1000:.1f}K/s")
-                else:
-                    parts.append(f"{speed_to_show/1_000_000:.1f}M/s")
+        speed_to_show = speed if speed is not None else computed_speed
+        return bar + format_info(progress, current, eta, speed_to_show)
+
+    def render(
+        progress: float,
+        current: Optional[int] = None,
+        eta: Optional[float] = None,
+        speed: Optional[float] = None
+    ) -> str:
+        """
+        Render the progress bar line according to selected style
         
-        extra = " │ " + "  ".join(parts) if parts else ""
+        Does no I/O: the line comes back without the leading carriage
+        return or the newline on completion, so callers such as
+        MultiProgress can compose several bars into a single write.
         
-        line = f"\r{bar}{extra}"
-        sys.stdout.write(line)
-        sys.stdout.flush()
+        Args:
+            progress: 0..1
+            current: Current item count (if show_counter=True)
+            eta: Estimated time remaining in seconds (if show_eta=True)
+            speed: Operations per second (if show_speed=True)
+        """
+        return _render(_clamp(progress), current, eta, speed)
+
+    if not line_mode:
+        # Live bar redrawn in place with "\r"
+        def draw(
+            progress: float,
+            current: Optional[int] = None,
+            eta: Optional[float] = None,
+            speed: Optional[float] = None
+        ):
+            """Draw progress bar, flushing at most refresh_hz times per second"""
+            nonlocal _last_render_t, _last_bucket
+            
+            progress = _clamp(progress)
+            
+            # Fast path: nothing visible changed since the last frame
+            now = _monotonic()
+            bucket = int(progress * bucket_scale)
+            if bucket == _last_bucket and now - _last_render_t < flush_interval and progress < 1.0:
+                # Still write out a frame left pending by an earlier call
+                if _buf and now - last_flush >= flush_interval:
+                    flush()
+                return
+            _last_bucket = bucket
+            _last_render_t = now
+            
+            line = _render(progress, current, eta, speed)
+            
+            # A new frame overwrites the pending one, so only keep the latest
+            _buf.clear()
+            _buf.append("\r")
+            _buf.append(line)
+            
+            # Print newline when complete
+            if progress >= 1:
+                _buf.append("\n")
+                flush()
+            elif now - last_flush >= flush_interval:
+                flush()
+
+    else:
+        # Files and CI logs can't redraw a line with "\r", so instead of
+        # every frame write one plain line per 10% step
+        last_step = -1
         
-        # Print newline when complete
-        if progress >= 1:
-            sys.stdout.write("\n")
-            sys.stdout.flush()
+        def draw(
+            progress: float,
+            current: Optional[int] = None,
+            eta: Optional[float] = None,
+            speed: Optional[float] = None
+        ):
+            """Draw progress bar as a new line at each 10% step"""
+            nonlocal last_step
+            progress = _clamp(progress)
+            step = int(progress * 10)
+            if step <= last_step:
+                return
+            last_step = step
+            _write(_render(progress, current, eta, speed) + "\n")
+            _flush()
 
+    draw.render = render
+    draw.flush = flush
     return draw
 
 
+_T = TypeVar("_T")
+
+
+def iter_wrap(
+    iterable: Iterable[_T],
+    total: int,
+    drawer: Callable[..., None],
+    refresh_hz: float = 30.0
+) -> Iterator[_T]:
+    """
+    Yield items from iterable while drawing progress with drawer.
+    
+    Instead of drawing on every item, draws every Nth item and tunes N at
+    runtime so the drawer is called about refresh_hz times per second,
+    however fast the loop runs. The final count is always drawn and the
+    drawer flushed, even when the loop exits early via break or an
+    exception.
+    
+    Drawing stops once a completed frame (count >= total) has been drawn,
+    so a total smaller than the real length completes the bar only once.
+    A total of 0 or less means the length is unknown: progress stays at
+    0 (the counter still updates) until the iterable is exhausted, which
+    draws the completed bar.
+    
+    Example:
+        draw = get_progress_drawer("block", show_counter=True)
+        for item in iter_wrap(items, len(items), draw):
+            ...
+    """
+    _monotonic = time.monotonic
+    target_dt = 1.0 / refresh_hz if refresh_hz > 0 else 0.0
+    step = 1
+    next_draw = 1
+    count = 0
+    drawn = 0
+    done = False
+    exhausted = False
+    last_t = _monotonic()
+    
+    try:
+        for item in iterable:
+            yield item
+            count += 1
+            if count >= next_draw:
+                now = _monotonic()
+                dt = now - last_t
+                # Keep the draw interval near target_dt
+                if dt < target_dt * 0.5:
+                    step *= 2
+                elif dt > target_dt * 2 and step > 1:
+                    step //= 2
+                drawer(count / total if total > 0 else 0.0, count)
+                last_t = now
+                drawn = count
+                done = 0 < total <= count
+                # After the completed frame there is nothing left to draw
+                next_draw = float("inf") if done else count + step
+        exhausted = True
+    finally:
+        if not done:
+            if exhausted and total <= 0:
+                drawer(1.0, count)
+            elif count != drawn:
+                drawer(count / total if total > 0 else 0.0, count)
+        # Drawers buffer their newest frame; make sure it reaches the screen
+        flush = getattr(drawer, "flush", None)
+        if flush is not None:
+            flush()
+
+
 # Multi-bar display (simple implementation)
 class MultiProgress:
     """
@@ -377,31 +546,34 @@ class MultiProgress:
     
     def __init__(self, count: int, style: str = "block", width: int = 30):
         self.count = count
-        self.drawers = [get_progress_drawer(style, width, show_percentage=False) 
-                       for _ in range(count)]
+        # Bars only differ in progress and label, so they share one drawer
+        # (and its precomputed tables) and just render through it
+        self._renderer = get_progress_drawer(style, width, show_percentage=False)
         self.lines_written = 0
+        # Last line drawn for each bar, so unchanged bars are never rewritten
+        self._last_lines: List[str] = [""] * count
     
     def update(self, index: int, progress: float, label: str = ""):
         """Update a specific progress bar"""
         if index < 0 or index >= self.count:
             raise IndexError(f"Index {index} out of range (0-{self.count-1})")
         
-        # Move cursor to the right line
-        if self.lines_written:
-            sys.stdout.write(f"\033[{self.lines_written}A")  # Move up
+        prefix = f"{label}: " if label else f"Bar {index+1}: "
+        line = f"{prefix}{self._renderer.render(progress)}"
+        if line == self._last_lines[index]:
+            return
+        self._last_lines[index] = line
         
-        # Update all bars
-        for i in range(self.count):
-            if i == index:
-                prefix = f"{label}: " if label else f"Bar {i+1}: "
-                sys.stdout.write(prefix)
-                self.drawers[i](progress)
-                sys.stdout.write("\n")
-            else:
-                # Just keep existing line
-                sys.stdout.write("\n")
+        if self.lines_written:
+            # Move up to the bar's line, rewrite it, and move back down
+            up = self.lines_written - index
+            frame = f"\033[{up}A\r{line}\033[K\033[{up}B\r"
+        else:
+            # First update lays out one line per bar
+            frame = "\n".join(self._last_lines) + "\n"
+            self.lines_written = self.count
         
-        self.lines_written = self.count
+        sys.stdout.write(frame)
         sys.stdout.flush()
     
     def complete(self):